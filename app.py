@@ -0,0 +1,115 @@
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# Imported so pickles referencing the shared module (or __main__) resolve
+from hybrid_recommender import HybridRecommendationSystem_Custom  # noqa: F401
+
+DATA_DIR = "Dataset/raw"
+FEEDBACK_PATH = os.path.join(DATA_DIR, "feedback.jsonl")
+# Trained and pickled by the training notebook; not checked into the repo
+MODEL_PATH = "hybrid_model.pkl"
+
+st.set_page_config(page_title="Hybrid Book Recommender", page_icon="📖")
+
+
+def data_mtime():
+    # Cheap fingerprint of the data on disk, used as a cache key below
+    mtime = os.path.getmtime(os.path.join(DATA_DIR, "ratings.parquet"))
+    if os.path.exists(FEEDBACK_PATH):
+        mtime = max(mtime, os.path.getmtime(FEEDBACK_PATH))
+    return mtime
+
+
+@st.cache_data
+def load_ratings(ratings_mtime):
+    # ratings_mtime is only the cache key: new feedback on disk reloads this
+    ratings = pd.read_parquet(os.path.join(DATA_DIR, "ratings.parquet"),
+                              columns=["user_id", "book_id", "rating"])
+    # Merge in any feedback collected since the parquet file was built
+    if os.path.exists(FEEDBACK_PATH):
+        feedback = pd.read_json(FEEDBACK_PATH, lines=True)
+        ratings = pd.concat([ratings, feedback], ignore_index=True)
+    return ratings
+
+
+@st.cache_data
+def load_books():
+    return pd.read_parquet(os.path.join(DATA_DIR, "books.parquet"),
+                           columns=["book_id", "title", "authors"])
+
+
+@st.cache_data
+def user_ids(ratings_mtime):
+    return tuple(int(x) for x in np.sort(ratings["user_id"].unique()))
+
+
+@st.cache_data
+def feedback_book_ids(ratings_mtime):
+    return tuple(int(x) for x in books["book_id"].head(50))
+
+
+@st.cache_data
+def popular_books(ratings_mtime):
+    # ratings_mtime is only the cache key, so appended feedback refreshes this
+    return (ratings.groupby("book_id")["rating"].agg(["mean", "count"])
+            .query("count >= 10").sort_values("mean", ascending=False))
+
+
+@st.cache_resource
+def load_hybrid():
+    # cache_resource: the unpickled model is shared across reruns as-is,
+    # with no re-pickling of the (large) object for cache storage.
+    # Missing model -> None; the app then serves the popularity fallback
+    if not os.path.exists(MODEL_PATH):
+        return None
+    with open(MODEL_PATH, "rb") as f:
+        return pickle.load(f)
+
+
+ratings = load_ratings(data_mtime())
+books = load_books()
+hybrid_system = load_hybrid()
+
+st.title("📖 Hybrid Book Recommender")
+if hybrid_system is None:
+    st.warning(f"{MODEL_PATH} not found — train it with the notebook first. "
+               "Serving popularity-based picks only.")
+st.write("Personalized picks combining collaborative and content-based filtering.")
+
+user_id = st.sidebar.selectbox("Select User ID:", user_ids(data_mtime()))
+top_n = st.sidebar.slider("Number of recommendations:", 5, 20, 10)
+
+if st.sidebar.button("Recommend"):
+    recs = []
+    if hybrid_system is not None:
+        seen = set(ratings.loc[ratings["user_id"] == user_id, "book_id"])
+        candidates = [b for b in books["book_id"] if b not in seen]
+        recs = hybrid_system.recommend(user_id, candidates, top_n=top_n)
+
+    if not recs:
+        # Fall back to globally popular books for cold-start users
+        popular = popular_books(data_mtime()).head(top_n)
+        recs = list(zip(popular.index, popular["mean"]))
+
+    # Left join so a missing title can never silently drop a recommendation
+    rec_df = (pd.DataFrame(recs, columns=["book_id", "score"])
+              .merge(books, on="book_id", how="left"))
+    rec_df["title"] = rec_df["title"].fillna(rec_df["book_id"].map("Book #{}".format))
+    st.subheader(f"Top {top_n} picks for user {user_id}")
+    # One dataframe message instead of a Streamlit call per row
+    st.dataframe(rec_df[["title", "authors", "score"]], use_container_width=True,
+                 hide_index=True)
+
+st.sidebar.markdown("---")
+st.sidebar.subheader("Rate a book")
+book_id_fb = st.sidebar.selectbox("Book ID:", feedback_book_ids(data_mtime()))
+rating_val = st.sidebar.slider("Your rating:", 1, 5, 3)
+if st.sidebar.button("Submit rating"):
+    # Plain append of one JSON line: no DataFrame or CSV writer on the click path
+    with open(FEEDBACK_PATH, "a") as f:
+        f.write(f'{{"user_id": {user_id}, "book_id": {book_id_fb}, "rating": {rating_val}}}\n')
+    st.sidebar.success("Thanks for the feedback!")
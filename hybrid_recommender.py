@@ -0,0 +1,103 @@
+"""Hybrid recommendation model shared by app.py and prepare_data.py.
+
+The trained instance is pickled to hybrid_model.pkl by the training
+notebook; the class lives here (not in app.py) so any script that
+unpickles the model can resolve it.
+"""
+
+import numpy as np
+
+
+class HybridRecommendationSystem_Custom:
+    """Weighted blend of a collaborative filtering model and a content-based model."""
+
+    def __init__(self, cf_model=None, cb_model=None, weights=(0.6, 0.4)):
+        self.cf_model = cf_model
+        self.cb_model = cb_model
+        self.weights = weights
+        self._known_items = self._build_known_items()
+        self.predict = self._make_predict()
+
+    def _build_known_items(self):
+        """Items both models can score, so recommend() never hits a miss."""
+        known = None
+        if self.cf_model is not None and hasattr(self.cf_model, "trainset"):
+            trainset = self.cf_model.trainset
+            known = {trainset.to_raw_iid(i) for i in trainset.all_items()}
+        if self.cb_model is not None and hasattr(self.cb_model, "item_index"):
+            cb_known = set(self.cb_model.item_index)
+            known = cb_known if known is None else known & cb_known
+        return known
+
+    def _make_predict(self):
+        """Bind a predict specialized for the configured models once, instead of
+        branching on self.cf_model/self.cb_model on every call."""
+        w0, w1 = self.weights
+        cf, cb = self.cf_model, self.cb_model
+        if cf is not None and cb is not None:
+            def predict(user_id, item_id):
+                return w0 * cf.predict(user_id, item_id).est + w1 * cb.predict(user_id, item_id)
+        elif cf is not None:
+            def predict(user_id, item_id):
+                return w0 * cf.predict(user_id, item_id).est
+        elif cb is not None:
+            def predict(user_id, item_id):
+                return w1 * cb.predict(user_id, item_id)
+        else:
+            def predict(user_id, item_id):
+                raise ValueError("no models configured")
+        return predict
+
+    def __getstate__(self):
+        # The specialized predict closure is not picklable; rebuild it on load
+        state = self.__dict__.copy()
+        state.pop("predict", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if "_known_items" not in self.__dict__:
+            self._known_items = self._build_known_items()
+        self.predict = self._make_predict()
+
+    def predict_batch(self, user_id, items):
+        """Score every candidate in one pass, returning (cf_scores, cb_scores) arrays."""
+        n = len(items)
+        cf = np.zeros(n)
+        cb = np.zeros(n)
+        if self.cf_model:
+            if hasattr(self.cf_model, "predict_batch"):
+                cf = np.asarray(self.cf_model.predict_batch(user_id, items), dtype=np.float64)
+            else:
+                cf = np.fromiter((self.cf_model.predict(user_id, i).est for i in items),
+                                 dtype=np.float64, count=n)
+        if self.cb_model:
+            if hasattr(self.cb_model, "predict_batch"):
+                cb = np.asarray(self.cb_model.predict_batch(user_id, items), dtype=np.float64)
+            else:
+                cb = np.fromiter((self.cb_model.predict(user_id, i) for i in items),
+                                 dtype=np.float64, count=n)
+        return cf, cb
+
+    def recommend(self, user_id, items, top_n=10):
+        # Filter to scoreable items once up front instead of wrapping the
+        # scoring loop in a per-item try/except
+        if self._known_items is not None:
+            items = [i for i in items if i in self._known_items]
+        if len(items) == 0:
+            return []
+        cf, cb = self.predict_batch(user_id, items)
+        # Blend and rank entirely in NumPy; unknown items score NaN -> 0
+        scores = np.nan_to_num(self.weights[0] * cf + self.weights[1] * cb)
+        top_n = min(top_n, len(scores))
+        top = np.argpartition(-scores, top_n - 1)[:top_n]
+        top = top[np.argsort(-scores[top])]
+        return list(zip(np.asarray(items)[top], scores[top]))
+
+
+# Pickles written from a notebook or Streamlit session reference this class
+# under __main__; alias it there so pickle.load can still resolve them
+import __main__  # noqa: E402
+
+if not hasattr(__main__, "HybridRecommendationSystem_Custom"):
+    __main__.HybridRecommendationSystem_Custom = HybridRecommendationSystem_Custom
@@ -0,0 +1,130 @@
+"""One-time script that builds the artifacts served by book_dashboard.py.
+
+Run this after updating the raw CSVs:
+
+    python prepare_data.py
+
+Pass --full-matrix to additionally materialize the dense N x N
+similarity matrix instead of just the item embeddings.
+"""
+
+import argparse
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+
+# Imported so resave_hybrid_model can unpickle instances of the class
+# (hybrid_recommender also aliases it under __main__ for older pickles)
+from hybrid_recommender import HybridRecommendationSystem_Custom  # noqa: F401
+from vector_operations import cosine_similarity_matrix
+
+RAW_DIR = "Dataset/raw"
+OUT_DIR = "dashboard_data"
+
+
+def build_pivot_table():
+    ratings = pd.read_csv(os.path.join(RAW_DIR, "ratings.csv"))
+    books = pd.read_csv(os.path.join(RAW_DIR, "books.csv"))
+    # ratings.book_id holds the dense 1..N ids from books["id"];
+    # books["book_id"] is the (much larger) Goodreads id — don't join on it
+    titles = books[["id", "title"]].rename(columns={"id": "book_id"})
+    df = ratings.merge(titles, on="book_id")
+
+    # Keep active users and popular books so the pivot table stays manageable
+    ratings_per_user = df.groupby("user_id")["rating"].count()
+    df = df[df["user_id"].isin(ratings_per_user[ratings_per_user >= 50].index)]
+    ratings_per_book = df.groupby("title")["rating"].count()
+    df = df[df["title"].isin(ratings_per_book[ratings_per_book >= 50].index)]
+
+    return df.pivot_table(index="title", columns="user_id", values="rating").fillna(0)
+
+
+def convert_csvs_to_parquet():
+    # One-time conversion so app.py can skip CSV parsing on every rerun
+    ratings = pd.read_csv(os.path.join(RAW_DIR, "ratings.csv"),
+                          usecols=["user_id", "book_id", "rating"])
+    ratings.to_parquet(os.path.join(RAW_DIR, "ratings.parquet"), compression="zstd")
+    print("Converted ratings.csv -> ratings.parquet")
+
+    # Carry books["id"] — the dense id that ratings.book_id refers to — as
+    # the canonical book_id, so app.py works in one id space end to end
+    books = (pd.read_csv(os.path.join(RAW_DIR, "books.csv"),
+                         usecols=["id", "title", "authors"])
+             .rename(columns={"id": "book_id"}))
+    books.to_parquet(os.path.join(RAW_DIR, "books.parquet"), compression="zstd")
+    print("Converted books.csv -> books.parquet")
+
+
+def resave_hybrid_model(path="hybrid_model.pkl"):
+    # Re-save with protocol 5 (out-of-band buffers for NumPy arrays),
+    # which loads without per-byte copying of large buffers
+    if not os.path.exists(path):
+        return
+    with open(path, "rb") as f:
+        hybrid_system = pickle.load(f)
+    with open(path, "wb") as f:
+        pickle.dump(hybrid_system, f, protocol=pickle.HIGHEST_PROTOCOL)
+    print(f"Re-saved {path} with pickle protocol {pickle.HIGHEST_PROTOCOL}")
+
+
+def normalize_rows(values):
+    norms = np.linalg.norm(values, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return values / norms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--full-matrix", action="store_true",
+                        help="also save the dense N x N similarity matrix")
+    parser.add_argument("--quant", choices=["int8", "fp16"],
+                        help="additionally save a quantized similarity matrix "
+                             "(implies --full-matrix)")
+    args = parser.parse_args()
+
+    os.makedirs(OUT_DIR, exist_ok=True)
+    convert_csvs_to_parquet()
+    resave_hybrid_model()
+
+    pt = build_pivot_table()
+    pt.to_pickle(os.path.join(OUT_DIR, "pt.pkl"))
+
+    # L2-normalized item embeddings: E @ E[i] reproduces row i of the cosine
+    # similarity matrix on demand, so we store O(N*d) floats instead of O(N^2).
+    # float32 is plenty for ranking and halves the bytes read per query;
+    # .npy (instead of pickle) lets the dashboard memory-map the arrays
+    embeddings = normalize_rows(pt.values.astype(np.float32))
+    np.save(os.path.join(OUT_DIR, "embeddings.npy"), embeddings)
+
+    if args.full_matrix or args.quant:
+        values = pt.values.astype(np.float32)
+        similarities = cosine_similarity_matrix(values, values)
+        np.save(os.path.join(OUT_DIR, "similarities.npy"), similarities)
+        if args.quant == "int8":
+            # Cosines are in [0, 1] here, so scale straight to [0, 127].
+            # Ranking only needs order, which the quantization preserves
+            sim_q = np.clip(np.round(similarities * 127), -128, 127).astype(np.int8)
+            np.save(os.path.join(OUT_DIR, "similarities_int8.npy"), sim_q)
+        elif args.quant == "fp16":
+            np.save(os.path.join(OUT_DIR, "similarities_fp16.npy"),
+                    similarities.astype(np.float16))
+
+    # Remove matrix variants this run didn't (re)build: book_dashboard.py
+    # prefers them when present, and a leftover from an earlier run would
+    # silently serve similarities for stale data
+    stale = [f"similarities_{v}.npy" for v in ("int8", "fp16") if v != args.quant]
+    if not (args.full_matrix or args.quant):
+        stale.append("similarities.npy")
+    for fname in stale:
+        path = os.path.join(OUT_DIR, fname)
+        if os.path.exists(path):
+            os.remove(path)
+            print(f"Removed stale {fname}")
+
+    print(f"Saved {len(pt)} books to {OUT_DIR}/")
+
+
+if __name__ == "__main__":
+    main()
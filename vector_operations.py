@@ -0,0 +1,36 @@
+"""Numba kernels for the similarity computations in prepare_data.py."""
+
+import numpy as np
+from numba import njit, prange
+
+BLOCK = 64  # row-block size; keeps each tile cache-resident
+
+
+@njit(fastmath=True, cache=True)
+def l2_normalize_rows(A):
+    out = np.empty_like(A)
+    for i in range(A.shape[0]):
+        norm = 0.0
+        for j in range(A.shape[1]):
+            norm += A[i, j] * A[i, j]
+        norm = np.sqrt(norm)
+        if norm == 0.0:
+            norm = 1.0
+        for j in range(A.shape[1]):
+            out[i, j] = A[i, j] / norm
+    return out
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def cosine_similarity_matrix(A, B):
+    """Cosine similarity between every row of A (n x d) and of B (m x d)."""
+    An = l2_normalize_rows(A)
+    Bn_T = l2_normalize_rows(B).T.copy()
+    n = An.shape[0]
+    out = np.empty((n, Bn_T.shape[1]), dtype=An.dtype)
+    n_blocks = (n + BLOCK - 1) // BLOCK
+    for b in prange(n_blocks):
+        start = b * BLOCK
+        stop = min(start + BLOCK, n)
+        out[start:stop] = np.dot(An[start:stop], Bn_T)
+    return out